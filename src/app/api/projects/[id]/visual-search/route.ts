@@ -246,6 +246,8 @@ export async function POST(
     }
 
     const embedding = embedResult.embedding;
+    // pgvector literal, serialized once for both the distance and ORDER BY terms
+    const embeddingLiteral = JSON.stringify(embedding);
 
     // Search for similar embeddings in the database
     // Using cosine similarity with pgvector
@@ -257,7 +259,7 @@ export async function POST(
         sr.x,
         sr.y,
         sr.ocr_text,
-        1 - (sr.embedding <=> ${JSON.stringify(embedding)}::vector) as similarity
+        1 - (sr.embedding <=> ${embeddingLiteral}::vector) as similarity
       FROM symbol_regions sr
       JOIN documents d ON d.id = sr.document_id
       WHERE d.bid_id = ${projectId}
@@ -270,7 +272,7 @@ export async function POST(
             AND ABS(y - ${y}) < 0.05
           LIMIT 1
         )
-      ORDER BY sr.embedding <=> ${JSON.stringify(embedding)}::vector
+      ORDER BY sr.embedding <=> ${embeddingLiteral}::vector
       LIMIT 20
     `);
 